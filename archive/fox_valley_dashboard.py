@@ -17,11 +17,9 @@ from modules.portfolio_engine import (
 )
 
 from modules.zacks_engine import (
-    load_zacks_files_auto,
-    merge_zacks_screens,
-    score_zacks_candidates,
+    load_scored_candidates,
     get_top_n,
-    highlight_rank_1,
+    highlight_rank_1_frame,
 )
 
 from modules.dashboard_engine import attach_trailing_stops
@@ -93,15 +91,13 @@ with st.sidebar:
 # DATA INGESTION
 # ============================================================
 portfolio_df, portfolio_filename = load_portfolio()
-zacks_files = load_zacks_files_auto()
+zacks_files, scored_candidates = load_scored_candidates()
 
 # Portfolio metrics
 total_value, cash_value, avg_gain = compute_portfolio_metrics(portfolio_df)
 available_cash = manual_cash if manual_cash > 0 else cash_value
 
-# Zacks processing
-zacks_unified = merge_zacks_screens(zacks_files)
-scored_candidates = score_zacks_candidates(zacks_unified)
+# Zacks processing (screens + scores cached until a screen file changes)
 top_n_df = get_top_n(scored_candidates, top_n)
 
 # ============================================================
@@ -135,20 +131,20 @@ render_zacks_intel_brief(scored_candidates)
 st.markdown("## 🔎 Zacks Unified Analyzer — Top Candidates")
 
 if not top_n_df.empty:
-    st.dataframe(top_n_df.style.apply(highlight_rank_1, axis=1), use_container_width=True)
+    st.dataframe(top_n_df.style.apply(highlight_rank_1_frame, axis=None), use_container_width=True)
 else:
     st.warning("No Zacks candidates available for Top-N view.")
 
 # ============================================================
 # 📂 ZACKS TACTICAL SCREENS (RAW DATA)
 # ============================================================
-show_dataframe(zacks_files)
+show_dataframe(zacks_files, key="zacks_screens")
 
 # ============================================================
 # 📊 PORTFOLIO POSITIONS (WITH TRAILING STOPS)
 # ============================================================
 portfolio_with_stops = attach_trailing_stops(portfolio_df, default_trailing_stop)
-show_dataframe({"Portfolio Positions": portfolio_with_stops})
+show_dataframe({"Portfolio Positions": portfolio_with_stops}, key="portfolio")
 
 # ============================================================
 # 🎯 TACTICAL OPERATIONS PANEL
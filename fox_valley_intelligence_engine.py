@@ -9,6 +9,7 @@ from modules.risk_and_reporting_engine import apply_stop_logic, export_to_csv, e
 from modules.profit_risk_analyzer import evaluate_profit_risk  # NEW MODULE INTEGRATION
 
 DATA_PATH = "data"
+ZACKS_CATEGORIES = ["Growth", "Defensive"]
 
 
 def load_most_recent_file(keyword: str):
@@ -24,11 +25,29 @@ def load_most_recent_file(keyword: str):
     if not files:
         return None
 
-    files.sort()
-    latest = files[-1]
+    latest = max(files)
     return os.path.join(DATA_PATH, latest)
 
 
+def latest_files(keywords):
+    """Return {keyword: path} for the most recent CSV per keyword in one /data scan."""
+    if not os.path.isdir(DATA_PATH):
+        print(f"⚠ Data folder not found: {DATA_PATH}")
+        return {}
+
+    latest = {}
+    with os.scandir(DATA_PATH) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            if not name.endswith(".csv"):
+                continue
+            for keyword in keywords:
+                if keyword.lower() in name and entry.name > latest.get(keyword, ""):
+                    latest[keyword] = entry.name
+
+    return {k: os.path.join(DATA_PATH, latest[k]) for k in keywords if k in latest}
+
+
 def load_portfolio():
     """Load latest portfolio CSV."""
     path = load_most_recent_file("Portfolio")
@@ -48,19 +67,18 @@ def load_portfolio():
 
 def load_zacks_files():
     """Load latest Zacks screens for Growth and Defensive groups."""
-    categories = ["Growth", "Defensive"]
     loaded = {}
 
-    for cat in categories:
-        path = load_most_recent_file(cat)
-        if path:
-            print(f"📥 Loaded Zacks File: {os.path.basename(path)}")
-            try:
-                zdf = pd.read_csv(path)
-                zdf['Ticker'] = zdf['Ticker'].astype(str).str.upper()
-                loaded[cat] = zdf
-            except Exception as e:
-                print(f"⚠ Error loading {path}: {e}")
+    # One directory scan resolves every category
+    for cat, path in latest_files(ZACKS_CATEGORIES).items():
+        print(f"📥 Loaded Zacks File: {os.path.basename(path)}")
+        try:
+            # Zacks exports are clean rectangular CSVs — parse with Arrow
+            zdf = pd.read_csv(path, engine="pyarrow")
+            zdf['Ticker'] = zdf['Ticker'].astype(str).str.upper()
+            loaded[cat] = zdf
+        except Exception as e:
+            print(f"⚠ Error loading {path}: {e}")
 
     if not loaded:
         print("\n⚠ No Zacks screening files found in /data.")
@@ -93,16 +111,22 @@ def crossmatch_with_zacks(portfolio_df: pd.DataFrame, zacks_data: dict):
         print("\n⚠ No Zacks datasets available for tactical crossmatch.")
         return None
 
+    held = frozenset(portfolio_df["Ticker"])
+    pf_idx = portfolio_df.set_index("Ticker")
     all_matches = []
 
     for category, zdf in zacks_data.items():
         if "Ticker" not in zdf.columns:
             continue
 
-        merged = pd.merge(portfolio_df, zdf, on="Ticker", how="inner", suffixes=("", "_z"))
-        if not merged.empty:
-            merged["Screen Category"] = category
-            all_matches.append(merged)
+        # Narrow each screen to held tickers first — the merge only sees hits
+        zdf = zdf[zdf["Ticker"].isin(held)]
+        if zdf.empty:
+            continue
+
+        merged = pf_idx.join(zdf.set_index("Ticker"), how="inner", rsuffix="_z").reset_index()
+        merged["Screen Category"] = category
+        all_matches.append(merged)
 
     if not all_matches:
         print("\n📭 No matches from Zacks screens.")
@@ -21,15 +21,14 @@ def render_portfolio_weight_heatmap(portfolio_df):
         st.warning("Missing 'Current Value' column for portfolio weight analysis.")
         return
 
-    total_cv = pd.to_numeric(portfolio_df["Current Value"], errors="coerce").fillna(0).sum()
+    current_value = pd.to_numeric(portfolio_df["Current Value"], errors="coerce").fillna(0)
+    total_cv = current_value.sum()
     if total_cv <= 0:
         st.warning("Total portfolio value is zero — cannot compute weights.")
         return
 
     weight_df = portfolio_df.copy()
-    weight_df["Weight %"] = (
-        pd.to_numeric(weight_df["Current Value"], errors="coerce").fillna(0) / total_cv
-    ) * 100
+    weight_df["Weight %"] = (current_value / total_cv) * 100
 
     fig_weight = px.imshow(
         [weight_df["Weight %"]],
@@ -84,7 +83,11 @@ def render_zacks_composite_heatmap(scored_candidates):
         st.warning("CompositeScore column missing — heat map aborted.")
         return
 
-    comp_df = scored_candidates[["Ticker", "CompositeScore"]].reset_index(drop=True)
+    comp_df = (
+        scored_candidates[["Ticker", "CompositeScore"]]
+        .sort_values("CompositeScore", ascending=False)
+        .reset_index(drop=True)
+    )
 
     fig_comp = px.imshow(
         [comp_df["CompositeScore"]],
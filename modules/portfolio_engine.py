@@ -4,6 +4,7 @@
 # ============================================================
 
 import os
+import re
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -15,6 +16,16 @@ DATA_DIR = "data"
 ARCHIVE_DIR = "archive"
 PORTFOLIO_FILE_PATTERN = "Portfolio_Positions"
 
+# Cash rows — Fidelity reports the core money market as "SPAXX**"
+CASH_TICKERS = frozenset({"CASH", "SPAXX", "SPAXX**"})
+
+# Archive history only reports total value — skip every other column at parse time
+HISTORY_COLUMNS = {"Current Value"}
+
+# Fidelity money formatting: "(123.45)" negatives, "$" and "," noise
+NEGATIVE_PAREN_RE = re.compile(r"\((.*?)\)")
+MONEY_NOISE_RE = re.compile(r"[\$,]")
+
 
 # ============================================================
 # CORE FILE LOADING UTILITIES
@@ -27,25 +38,35 @@ def load_latest_file(pattern, directory=DATA_DIR):
         files = [f for f in os.listdir(directory) if pattern in f and f.endswith(".csv")]
         if not files:
             return None, None
-        latest = sorted(files, key=lambda x: os.path.getmtime(os.path.join(directory, x)), reverse=True)[0]
+        latest = max(files, key=lambda x: os.path.getmtime(os.path.join(directory, x)))
         return pd.read_csv(os.path.join(directory, latest)), latest
     except Exception:
         return None, None
 
 
+def clean_portfolio_frame(df):
+    """Strips money formatting and normalizes Ticker to upper-case str once (NaN stays NaN)."""
+    df = df.replace(NEGATIVE_PAREN_RE, r"-\1", regex=True).replace(MONEY_NOISE_RE, "", regex=True)
+    df = df.apply(lambda col: pd.to_numeric(col, errors="ignore"))
+
+    if "Symbol" in df.columns:
+        df = df.rename(columns={"Symbol": "Ticker"})
+
+    if "Ticker" in df.columns:
+        tickers = df["Ticker"]
+        # Disclaimer rows carry no Symbol — keep them NaN, never the string "NAN"
+        df["Ticker"] = tickers.astype(str).str.strip().str.upper().where(tickers.notna())
+
+    return df
+
+
 def load_portfolio():
     """Loads and cleans the most recent portfolio file."""
     df, filename = load_latest_file(PORTFOLIO_FILE_PATTERN)
     if df is None:
         return None, None
 
-    df = df.replace(r"\((.*?)\)", r"-\1", regex=True).replace(r"[\$,]", "", regex=True)
-    df = df.apply(lambda col: pd.to_numeric(col, errors="ignore"))
-
-    if "Symbol" in df.columns:
-        df = df.rename(columns={"Symbol": "Ticker"})
-
-    return df, filename
+    return clean_portfolio_frame(df), filename
 
 
 # ============================================================
@@ -79,7 +100,7 @@ def compute_portfolio_metrics(df):
 
         avg_gain = (numeric_gain * current_value_series).sum() / total_value if total_value > 0 else None
 
-        cash_value = df[df["Ticker"].astype(str).str.lower() == "cash"]["Current Value"].sum() if "Ticker" in df.columns else 0.0
+        cash_value = df.loc[df["Ticker"].isin(CASH_TICKERS), "Current Value"].sum() if "Ticker" in df.columns else 0.0
 
         return float(total_value), float(cash_value), avg_gain
     except Exception:
@@ -107,12 +128,8 @@ def load_archive_portfolio_history():
             except:
                 dt = None
 
-            df = pd.read_csv(os.path.join(ARCHIVE_DIR, f))
-            df = df.replace(r"\((.*?)\)", r"-\1", regex=True).replace(r"[\$,]", "", regex=True)
-            df = df.apply(lambda col: pd.to_numeric(col, errors="ignore"))
-
-            if "Symbol" in df.columns:
-                df = df.rename(columns={"Symbol": "Ticker"})
+            df = pd.read_csv(os.path.join(ARCHIVE_DIR, f), usecols=lambda c: c in HISTORY_COLUMNS)
+            df = clean_portfolio_frame(df)
 
             total_value, _, _ = compute_portfolio_metrics(df)
 
@@ -33,8 +33,7 @@ def load_portfolio():
         print("⚠ No portfolio files found.")
         return None
 
-    files.sort()
-    latest = files[-1]
+    latest = max(files)
     print(f"🗂 Using Portfolio File: {latest}")
     return pd.read_csv(os.path.join(DATA_PATH, latest))
 
@@ -64,17 +63,14 @@ def calculate_profit_and_risk(df: pd.DataFrame):
 
 def apply_tactical_flags(df: pd.DataFrame):
     """Set Action Priority based on performance & risk."""
-    actions = []
-
-    for _, row in df.iterrows():
-        if row["Profit %"] >= TRIM_THRESHOLD * 100:
-            actions.append("Trim / Lock Profits")
-        elif row["Profit %"] <= ACCUMULATE_THRESHOLD * 100:
-            actions.append("Buy / Accumulate")
-        else:
-            actions.append("Hold / Monitor")
+    profit = df["Profit %"]
+    conditions = [
+        profit >= TRIM_THRESHOLD * 100,
+        profit <= ACCUMULATE_THRESHOLD * 100,
+    ]
+    actions = ["Trim / Lock Profits", "Buy / Accumulate"]
 
-    df["Tactical Action"] = actions
+    df["Tactical Action"] = np.select(conditions, actions, default="Hold / Monitor")
     return df
 
 
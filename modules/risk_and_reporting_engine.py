@@ -1,9 +1,13 @@
+import numpy as np
 import pandas as pd
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Paragraph, Spacer
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
 
+# PDF columns printed at two decimals; everything else prints as-is
+PDF_TWO_DP_COLUMNS = {"Current Price", "Gain/Loss %"}
+
 
 def apply_stop_logic(df: pd.DataFrame, stop_loss_pct: float = -15.0, trim_gain_pct: float = 25.0) -> pd.DataFrame:
     """
@@ -14,21 +18,20 @@ def apply_stop_logic(df: pd.DataFrame, stop_loss_pct: float = -15.0, trim_gain_p
     if "Gain/Loss %" not in df.columns:
         df["Gain/Loss %"] = None
 
-    df["Stop Recommendation"] = "Hold"
-
-    # Stop loss
-    df.loc[
-        df["Gain/Loss %"].notna() & (df["Gain/Loss %"] <= stop_loss_pct),
-        "Stop Recommendation",
-    ] = "Sell - Stop Loss Trigger"
+    gain = pd.to_numeric(df["Gain/Loss %"], errors="coerce").to_numpy(dtype=np.float64)
+    action = df["Action"].to_numpy() if "Action" in df.columns else np.full(len(df), None, dtype=object)
 
-    # Trim profits where strong gains but not already a Sell
-    df.loc[
-        df["Gain/Loss %"].notna()
-        & (df["Gain/Loss %"] >= trim_gain_pct)
-        & (df["Action"] != "Sell"),
-        "Stop Recommendation",
-    ] = "Trim - Secure Profits"
+    # Single pass — NaN gains fall through to Hold; trim keeps precedence over stop
+    df["Stop Recommendation"] = np.select(
+        [
+            # Trim profits where strong gains but not already a Sell
+            (gain >= trim_gain_pct) & (action != "Sell"),
+            # Stop loss
+            gain <= stop_loss_pct,
+        ],
+        ["Trim - Secure Profits", "Sell - Stop Loss Trigger"],
+        default="Hold",
+    )
 
     return df
 
@@ -65,9 +68,17 @@ def export_to_pdf(df: pd.DataFrame, filename: str = "tactical_intelligence_repor
         if c in df.columns
     ]
 
-    data = [cols] + df[cols].astype(str).values.tolist()
+    # Format column-at-a-time (price/percent floats to 2dp), then transpose to rows
+    formatted = [
+        np.char.mod("%.2f", df[c].to_numpy(dtype=np.float64))
+        if c in PDF_TWO_DP_COLUMNS and pd.api.types.is_float_dtype(df[c])
+        else df[c].astype(str).to_numpy()
+        for c in cols
+    ]
+    data = [cols]
+    data.extend(zip(*formatted))
 
-    table = Table(data, repeatRows=1)
+    table = LongTable(data, repeatRows=1)
     table.setStyle(
         TableStyle(
             [
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -17,18 +18,20 @@ def calculate_unrealized_gain(row):
     return None
 
 
+ZACKS_ACTIONS = {
+    1: "Strong Buy",
+    2: "Buy",
+    3: "Hold",
+    4: "Trim",
+    5: "Sell",
+}
+
+
 def zacks_signal(rank):
     """Map Zacks Rank (1-5) to basic tactical action."""
-    mapping = {
-        1: "Strong Buy",
-        2: "Buy",
-        3: "Hold",
-        4: "Trim",
-        5: "Sell",
-    }
     try:
         r = int(rank)
-        return mapping.get(r, "No Rating")
+        return ZACKS_ACTIONS.get(r, "No Rating")
     except Exception:
         return "No Rating"
 
@@ -45,27 +48,27 @@ def apply_tactical_rules(df: pd.DataFrame) -> pd.DataFrame:
 
     # Base Action from Zacks rank
     if "Zacks Rank" in df.columns:
-        df["Action"] = df["Zacks Rank"].apply(zacks_signal)
+        # Vectorized equivalent of zacks_signal over the whole column
+        ranks = pd.to_numeric(df["Zacks Rank"], errors="coerce")
+        df["Action"] = ranks.map(ZACKS_ACTIONS).fillna("No Rating")
     else:
         df["Action"] = "No Rating"
 
-    # Refinements based on performance
-    # If holding with strong gains, suggest trim
-    df.loc[
-        (df["Action"] == "Hold") & (df["Gain/Loss %"].notna()) & (df["Gain/Loss %"] > 20),
-        "Action",
-    ] = "Trim"
-
-    # If Zacks says Sell but gain is very high, call out profit taking
-    df.loc[
-        (df["Action"] == "Sell") & (df["Gain/Loss %"].notna()) & (df["Gain/Loss %"] > 30),
-        "Action",
-    ] = "Sell - Take Profits"
-
-    # If Zacks says Buy and stock is down significantly, highlight dip buy
-    df.loc[
-        (df["Action"] == "Buy") & (df["Gain/Loss %"].notna()) & (df["Gain/Loss %"] < -10),
-        "Action",
-    ] = "Buy More (Dip Buy)"
+    # Refinements based on performance — one pass, base actions are disjoint
+    gain = pd.to_numeric(df["Gain/Loss %"], errors="coerce")
+    action = df["Action"]
+    refinements = [
+        # If holding with strong gains, suggest trim
+        ((action == "Hold") & (gain > 20), "Trim"),
+        # If Zacks says Sell but gain is very high, call out profit taking
+        ((action == "Sell") & (gain > 30), "Sell - Take Profits"),
+        # If Zacks says Buy and stock is down significantly, highlight dip buy
+        ((action == "Buy") & (gain < -10), "Buy More (Dip Buy)"),
+    ]
+    df["Action"] = np.select(
+        [mask for mask, _ in refinements],
+        [label for _, label in refinements],
+        default=action,
+    )
 
     return df
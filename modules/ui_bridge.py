@@ -6,6 +6,9 @@
 import streamlit as st
 import pandas as pd
 
+# Rows shipped to the browser per dataframe render
+PAGE_SIZE = 50
+
 # ------------------------------------------------------------
 # METRIC CARDS (Top Overview)
 # ------------------------------------------------------------
@@ -64,17 +67,42 @@ def render_tactical_panel(buy_ticker, buy_shares, sell_ticker, sell_shares):
     st.caption("Order execution module placeholder — integration pending.")
 
 
+# ------------------------------------------------------------
+# PAGED DATAFRAME — only the visible slice is serialized
+# ------------------------------------------------------------
+def render_paged_dataframe(df, key):
+    if len(df) <= PAGE_SIZE:
+        st.dataframe(df, use_container_width=True)
+        return
+
+    last_page = (len(df) - 1) // PAGE_SIZE
+    page = st.number_input(
+        f"Page (0–{last_page})",
+        min_value=0,
+        max_value=last_page,
+        value=0,
+        step=1,
+        key=f"page_{key}",
+    )
+    start = int(page) * PAGE_SIZE
+    stop = min(start + PAGE_SIZE, len(df))
+
+    st.dataframe(df.iloc[start:stop], use_container_width=True)
+    st.caption(f"Rows {start + 1}–{stop} of {len(df)}")
+
+
 # ------------------------------------------------------------
 # GENERIC DATA DISPLAY ENGINE
 # Accepts:
 #   • A single DataFrame
 #   • A dict of { label: DataFrame }
 #   • A dict of { label: (DataFrame, filename) }
+# `key` namespaces the pager widgets — pass one per call site
 # ------------------------------------------------------------
-def show_dataframe(data):
-    # Single DataFrame
+def show_dataframe(data, key=None):
+    # Single DataFrame (default key derived from its columns, stable across reruns)
     if isinstance(data, pd.DataFrame):
-        st.dataframe(data, use_container_width=True)
+        render_paged_dataframe(data, key=key or "dataframe_" + "|".join(map(str, data.columns)))
         return
 
     # Dictionary-based
@@ -100,7 +128,7 @@ def show_dataframe(data):
             else:
                 st.markdown(f"### 📄 {label}")
 
-            st.dataframe(df, use_container_width=True)
+            render_paged_dataframe(df, key=f"{key}_{label}" if key else label)
         return
 
     st.warning("⚠ Unsupported data format for display.")
@@ -143,13 +171,16 @@ def render_zacks_intel_brief(scored_candidates):
     total_candidates = len(scored_candidates)
     unique_tickers = scored_candidates["Ticker"].nunique() if "Ticker" in cols else total_candidates
 
-    # Best-ranked candidate (top of CompositeScore-sorted frame)
+    # Best-ranked candidate (scored frame is not globally sorted — take the max)
     best_ticker = "—"
     best_score = None
     best_source = "—"
 
     try:
-        top_row = scored_candidates.iloc[0]
+        if "CompositeScore" in cols:
+            top_row = scored_candidates.loc[scored_candidates["CompositeScore"].idxmax()]
+        else:
+            top_row = scored_candidates.iloc[0]
         if "Ticker" in cols:
             best_ticker = str(top_row.get("Ticker", "—"))
         if "CompositeScore" in cols:
@@ -163,6 +194,7 @@ def render_zacks_intel_brief(scored_candidates):
     source_counts = None
     if "Source" in cols:
         source_counts = scored_candidates["Source"].value_counts()
+        source_counts = source_counts[source_counts > 0]  # categorical keeps empty screens
 
     # Display
     st.write(f"**Total Candidates Ranked:** {total_candidates}")
@@ -4,6 +4,11 @@
 # ============================================================
 
 import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 
@@ -12,59 +17,170 @@ import numpy as np
 # -----------------------------
 DATA_DIR = "data"
 ZACKS_PREFIX = "zacks_custom_screen"
+CACHE_DIR = ".cache"  # Parquet sidecars, created inside the screen directory
 
 VALID_SCREEN_TYPES = ["Growth1", "Growth2", "DefensiveDividend"]
 
+# Composite-score multiplier per screen source (unknown sources score as defensive)
+SOURCE_WEIGHTS = {"Growth1": 1.15, "Growth2": 1.10, "DefensiveDividend": 1.05}
+DEFAULT_SOURCE_WEIGHT = 1.05
+
+# SOURCE_WEIGHTS laid out by category code of the Source column (last slot: code -1)
+_SOURCE_WEIGHT_TABLE = np.array(
+    [SOURCE_WEIGHTS.get(c, DEFAULT_SOURCE_WEIGHT) for c in VALID_SCREEN_TYPES]
+    + [DEFAULT_SOURCE_WEIGHT],
+    dtype=np.float32,
+)
+
+# Screen export date embedded in each filename (YYYY-MM-DD)
+DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
 
 # ============================================================
 # 1️⃣ AUTO-DETECT ZACKS SCREEN FILES (LATEST DATE)
 # ============================================================
-def load_zacks_files_auto(directory=DATA_DIR):
-    """Automatically loads the most recent Zacks files (all three types)."""
-    import re
-    if not os.path.isdir(directory):
-        return {}
+def _screen_label(filename):
+    """Map a Zacks export filename to its screen type (None if unrecognized)."""
+    f_lower = filename.lower()
+    if "growth 1" in f_lower:
+        return "Growth1"
+    if "growth 2" in f_lower:
+        return "Growth2"
+    if "defensive" in f_lower or "dividend" in f_lower:
+        return "DefensiveDividend"
+    return None
+
+
+def _shrink_ints(df):
+    """Downcast integer columns (ranks, volumes) to the smallest type that fits."""
+    for col in df.select_dtypes("integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def _prune_sidecars(cache_dir, base):
+    """Drop older sidecars of `base` and any whose source CSV has left the directory."""
+    data_dir = os.path.dirname(cache_dir)
+    for old in os.listdir(cache_dir):
+        if not old.endswith(".parquet"):
+            continue
+        source = old.rsplit(".", 3)[0]  # "<csv name>.<mtime_ns>.<size>.parquet"
+        if source == base or not os.path.exists(os.path.join(data_dir, source)):
+            try:
+                os.remove(os.path.join(cache_dir, old))
+            except OSError:
+                pass  # already pruned by a concurrent session
 
-    files = [
-        f for f in os.listdir(directory)
-        if f.lower().startswith(ZACKS_PREFIX) and f.endswith(".csv")
-    ]
-    if not files:
-        return {}
 
+def _write_sidecar(df, cache_dir, base, cache_path):
+    """Persist a parsed screen as Parquet (atomically) and prune stale sidecars."""
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _prune_sidecars(cache_dir, base)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        os.close(fd)
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+        os.replace(tmp_path, cache_path)  # readers never see a half-written file
+        tmp_path = None
+    except Exception:
+        pass  # read-only dir or unserializable frame — the CSV stays the source of truth
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _read_screen(path):
+    """Parse one screen CSV, reusing its Parquet sidecar while the CSV is unchanged."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None  # moved or deleted since the directory scan — skip it
+    base = os.path.basename(path)
+    cache_dir = os.path.join(os.path.dirname(path), CACHE_DIR)
+    cache_path = os.path.join(cache_dir, f"{base}.{stat.st_mtime_ns}.{stat.st_size}.parquet")
+
+    if os.path.exists(cache_path):
+        try:
+            return pd.read_parquet(cache_path, engine="pyarrow")
+        except Exception:
+            pass  # unreadable sidecar — fall back to the CSV and rewrite it
+
+    if stat.st_size == 0:
+        return None  # empty export — nothing to parse
+
+    try:
+        df = pd.read_csv(path, engine="pyarrow")
+    except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError, OSError):
+        return None  # malformed or unreadable screen — skip it, let real bugs surface
+    df.columns = [c.strip() for c in df.columns]  # clean column names
+    df = _shrink_ints(df)
+
+    _write_sidecar(df, cache_dir, base, cache_path)
+    return df
+
+
+def _scan_screens(directory):
+    """Sorted (name, mtime_ns, size) of every Zacks CSV — changes whenever a screen does."""
+    screens = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not (entry.name.lower().startswith(ZACKS_PREFIX) and entry.name.endswith(".csv")):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue  # moved to archive/ mid-scan — it's no longer a current screen
+            screens.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(screens))
+
+
+@lru_cache(maxsize=4)
+def _load_latest_screens(directory, signature):
+    """Parse the newest-dated screens once per directory signature."""
     # Group by date
     date_map = {}
-    for f in files:
-        m = re.search(r"(\d{4}-\d{2}-\d{2})", f)
+    for f, _, _ in signature:
+        m = DATE_RE.search(f)
         if m:
             date_map.setdefault(m.group(1), []).append(f)
 
     if not date_map:
         return {}
 
-    newest_date = sorted(date_map.keys())[-1]
-    result = {}
+    newest_date = max(date_map)  # ISO dates compare lexicographically
 
+    targets = []
     for f in date_map[newest_date]:
-        f_lower = f.lower()
-        full_path = os.path.join(directory, f)
+        label = _screen_label(f)
+        if label:
+            targets.append((label, f))
 
-        try:
-            df = pd.read_csv(full_path)
-            df.columns = [c.strip() for c in df.columns]  # clean column names
-
-            if "growth 1" in f_lower:
-                result["Growth1"] = (df, f)
-            elif "growth 2" in f_lower:
-                result["Growth2"] = (df, f)
-            elif "defensive" in f_lower or "dividend" in f_lower:
-                result["DefensiveDividend"] = (df, f)
-        except Exception:
-            continue
+    # Arrow parsing releases the GIL — read the screens side by side
+    with ThreadPoolExecutor(max_workers=len(VALID_SCREEN_TYPES)) as pool:
+        frames = list(pool.map(_read_screen, [os.path.join(directory, f) for _, f in targets]))
+
+    result = {}
+    for (label, f), df in zip(targets, frames):
+        if df is not None:
+            result[label] = (df, f)
 
     return result
 
 
+def load_zacks_files_auto(directory=DATA_DIR):
+    """
+    Automatically loads the most recent Zacks files (all three types).
+    Parsed frames are cached until a screen file changes — treat them as read-only.
+    """
+    if not os.path.isdir(directory):
+        return {}
+
+    return dict(_load_latest_screens(directory, _scan_screens(directory)))
+
+
 # ============================================================
 # 2️⃣ PREPARATION & MERGING
 # ============================================================
@@ -72,9 +188,10 @@ def prepare_screen(df, label):
     """Standardize screen structure and tag source."""
     if df is None:
         return None
-    out = df.copy()
-    out.columns = [c.strip() for c in out.columns]
-    out["Source"] = label
+    # Shallow: shares the (cached) column data, new columns land on `out` only
+    out = df.rename(columns=str.strip, copy=False)
+    # Categorical over the fixed screen types — 1 byte per row, concat keeps the dtype
+    out["Source"] = pd.Categorical([label] * len(out), categories=VALID_SCREEN_TYPES)
     return out
 
 
@@ -92,66 +209,156 @@ def merge_zacks_screens(auto_dict):
     if not frames:
         return pd.DataFrame()
 
+    # Single concat over the collected list — never concat inside the loop.
+    # Screens carry different column sets (ints, floats, strings), so keep
+    # pd.concat's per-dtype union rather than stacking a single object array.
     return pd.concat(frames, ignore_index=True)
 
 
 # ============================================================
 # 3️⃣ COMPOSITE CANDIDATE SCORING ENGINE
 # ============================================================
+def _rank_score(ranks):
+    """Zacks Rank (1-5) as float; numeric columns skip string parsing entirely."""
+    if pd.api.types.is_numeric_dtype(ranks):
+        return ranks.astype(np.float32)
+    # Labels like "1-Strong Buy" lead with the digit — slice in Arrow, not per object
+    labels = ranks.astype("string[pyarrow]").str.strip()
+    score = pd.to_numeric(labels.str.slice(0, 1), errors="coerce")
+    misses = score.isna() & labels.notna()
+    if misses.any():
+        # Odd labels ("#2", "Rank 3") — first digit anywhere, as before
+        score[misses] = pd.to_numeric(labels[misses].str.extract(r"(\d)", expand=False), errors="coerce")
+    return score.astype(np.float32)
+
+
+def _col_f32(df, name):
+    """Column as float32 (NaN -> 0), or zeros if absent; float32 columns pass through."""
+    col = df.get(name)
+    if col is None:
+        return np.zeros(len(df), dtype=np.float32)
+    if col.dtype == np.float32:
+        return col.fillna(0.0) if col.hasnans else col
+    return pd.to_numeric(col, errors="coerce").fillna(0.0).astype(np.float32)
+
+
 def score_zacks_candidates(df):
-    """Generate composite scores using Rank, Momentum, Size, and Source Weight."""
+    """
+    Generate composite scores using Rank, Momentum, Size, and Source Weight.
+    Score columns are float32 — half the bytes per pass, ample precision here.
+    """
     if df is None or df.empty:
         return pd.DataFrame()
 
-    scored = df.copy()
+    # Shallow copy — score columns are added, existing columns are never written
+    scored = df.copy(deep=False)
 
     # Rank Score (inverted — Rank 1 highest)
     scored["RankScore"] = (
-        scored["Zacks Rank"].astype(str).str.extract(r"(\d)").astype(float)
-        if "Zacks Rank" in scored.columns else 5.0
+        _rank_score(scored["Zacks Rank"])
+        if "Zacks Rank" in scored.columns else np.float32(5.0)
     )
 
     # Momentum (from Price Change %)
-    scored["Momentum"] = (
-        pd.to_numeric(scored["Price Change %"], errors="coerce").fillna(0)
-        if "Price Change %" in scored.columns else 0.0
-    )
+    scored["Momentum"] = _col_f32(scored, "Price Change %")
 
     # Market Cap Scale
-    scored["SizeScore"] = (
-        pd.to_numeric(scored["Market Cap"], errors="coerce").fillna(0)
-        if "Market Cap" in scored.columns else 0.0
-    )
-
-    # Source Weighted Scaling
-    def weight(src):
-        return 1.15 if src == "Growth1" else 1.10 if src == "Growth2" else 1.05
+    scored["SizeScore"] = _col_f32(scored, "Market Cap")
+
+    # Source Weighted Scaling — categorical sources gather by code, no per-row lookup
+    source = scored["Source"]
+    if isinstance(source.dtype, pd.CategoricalDtype):
+        if list(source.cat.categories) == VALID_SCREEN_TYPES:
+            weights = _SOURCE_WEIGHT_TABLE  # prepare_screen layout — no rebuild
+        else:
+            weights = np.array(
+                [SOURCE_WEIGHTS.get(c, DEFAULT_SOURCE_WEIGHT) for c in source.cat.categories]
+                + [DEFAULT_SOURCE_WEIGHT],  # code -1 (missing) lands on the default
+                dtype=np.float32,
+            )
+        scored["SourceWeight"] = weights[source.cat.codes.to_numpy()]
+    else:
+        scored["SourceWeight"] = (
+            source.map(SOURCE_WEIGHTS).fillna(DEFAULT_SOURCE_WEIGHT).astype(np.float32)
+        )
+
+    # Composite Score Formula — plain arrays, one buffer updated in place
+    composite = (6.0 - scored["RankScore"].to_numpy(dtype=np.float32)) * 5.0
+    composite += scored["Momentum"].to_numpy(dtype=np.float32) * 0.2
+    composite += scored["SizeScore"].to_numpy(dtype=np.float32) * 0.00001
+    composite *= scored["SourceWeight"].to_numpy(dtype=np.float32)
+    scored["CompositeScore"] = composite
+
+    # Left unsorted — get_top_n selects by partition; sort explicitly if needed
+    return scored
+
+
+@lru_cache(maxsize=4)
+def _score_latest_screens(directory, signature):
+    """Merge + score the newest screens once per directory signature."""
+    return score_zacks_candidates(merge_zacks_screens(_load_latest_screens(directory, signature)))
+
+
+def load_scored_candidates(directory=DATA_DIR):
+    """
+    Latest screens plus their composite scores, recomputed only when a screen
+    file changes. Returns (zacks_files, scored) — treat the frames as read-only.
+    """
+    if not os.path.isdir(directory):
+        return {}, pd.DataFrame()
 
-    scored["SourceWeight"] = scored["Source"].apply(weight)
+    signature = _scan_screens(directory)
+    return dict(_load_latest_screens(directory, signature)), _score_latest_screens(directory, signature)
 
-    # Composite Score Formula
-    scored["CompositeScore"] = (
-        (6 - scored["RankScore"]) * 5
-        + scored["Momentum"] * 0.2
-        + scored["SizeScore"] * 0.00001
-    ) * scored["SourceWeight"]
 
-    return scored.sort_values("CompositeScore", ascending=False)
+def get_top_n(df, n):
+    """Return only the top-N candidates by composite score (best first)."""
+    if df is None or df.empty:
+        return pd.DataFrame()
 
+    n = min(int(n), len(df))
+    if n <= 0:
+        return df.iloc[:0]
 
-def get_top_n(df, n):
-    """Return only the top-N candidates by composite score."""
-    return df.head(n) if df is not None and not df.empty else pd.DataFrame()
+    # O(N) partition to the top n, then sort just those n
+    scores = df["CompositeScore"].to_numpy(dtype=np.float64)
+    idx = np.argpartition(-scores, n - 1)[:n]
+    idx = idx[np.argsort(-scores[idx], kind="stable")]
+    return df.take(idx)
 
 
 # ============================================================
 # 4️⃣ STYLE HELPER — HIGHLIGHT ZACKS RANK = 1
 # ============================================================
+RANK_1_CSS = "background-color: #ffeb3b33"
+
+# Prebuilt CSS rows per column count: +n highlighted, -n plain
+_HL_CACHE = {}
+
+
+def _css_row(n, highlight):
+    """Shared immutable CSS row for n columns — built once per width."""
+    key = n if highlight else -n
+    row = _HL_CACHE.get(key)
+    if row is None:
+        row = _HL_CACHE.setdefault(key, (RANK_1_CSS if highlight else "",) * n)
+    return row
+
+
 def highlight_rank_1(row):
     """Highlight rows with Zacks Rank = 1."""
+    hit = False
     try:
-        if "Zacks Rank" in row and str(row["Zacks Rank"]).strip() == "1":
-            return ['background-color: #ffeb3b33'] * len(row)
+        hit = "Zacks Rank" in row and str(row["Zacks Rank"]).strip() == "1"
     except Exception:
         pass
-    return [''] * len(row)
+    return list(_css_row(len(row), hit))
+
+
+def highlight_rank_1_frame(df):
+    """Highlight Zacks Rank = 1 rows in one pass — use with Styler.apply(axis=None)."""
+    css = np.full(df.shape, "", dtype=object)
+    if "Zacks Rank" in df.columns:
+        mask = df["Zacks Rank"].astype(str).str.strip().eq("1").to_numpy()
+        css[mask] = RANK_1_CSS
+    return pd.DataFrame(css, index=df.index, columns=df.columns)
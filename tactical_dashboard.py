@@ -7,17 +7,23 @@ Purpose:
     • Render actionable dashboard in Streamlit
 """
 
+import os
+from collections import namedtuple
+
 import streamlit as st
 import pandas as pd
 import glob
 
 from fox_valley_intelligence_engine import (
+    ZACKS_CATEGORIES,
+    latest_files,
     load_portfolio,
     load_zacks_files,
     crossmatch_with_zacks
 )
 
 from modules.profit_risk_analyzer import run_profit_risk_analyzer
+from modules.ui_bridge import render_paged_dataframe
 
 
 # ==========================
@@ -35,8 +41,47 @@ st.caption("v7.4R | Portfolio Risk, Profit, and Tactical Intelligence")
 # ==========================
 # Load Data Sources
 # ==========================
-portfolio_df = load_portfolio()
-zacks_data = load_zacks_files()
+def data_signature():
+    """Resolved source files + mtimes — a new or edited CSV changes the key."""
+    signature = []
+    for path in latest_files(["Portfolio", *ZACKS_CATEGORIES]).values():
+        try:
+            signature.append((path, os.path.getmtime(path)))
+        except OSError:
+            continue  # rotated out since the scan — the next rerun picks up its successor
+    return tuple(signature)
+
+
+OVERVIEW_COLUMNS = [
+    "Ticker", "Quantity", "Current Value",
+    "Total Gain/Loss Percent", "Percent Of Account",
+]
+
+DashboardState = namedtuple("DashboardState", ["portfolio", "zacks", "overview"])
+
+
+def build_overview(portfolio_df):
+    """Display frame built from the shown columns only, largest positions first."""
+    overview = portfolio_df[OVERVIEW_COLUMNS].assign(**{
+        "Current Value": portfolio_df["Current Value"].replace('[\$,]', '', regex=True).astype(float),
+        "Percent Of Account": portfolio_df["Percent Of Account"].replace('[\%,]', '', regex=True).astype(float),
+    })
+    return overview.sort_values("Current Value", ascending=False)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def build_state(signature):
+    """
+    Run the whole load + prep pipeline only when the source files change.
+    Frames are shared, not copied — treat them as read-only downstream.
+    """
+    portfolio_df = load_portfolio()
+    overview = build_overview(portfolio_df) if portfolio_df is not None else None
+    return DashboardState(portfolio_df, load_zacks_files(), overview)
+
+
+state = build_state(data_signature())
+portfolio_df, zacks_data = state.portfolio, state.zacks
 
 if portfolio_df is None:
     st.error("⚠ No Portfolio Data Found — Please upload a valid CSV to /data folder.")
@@ -51,16 +96,7 @@ if not zacks_data:
 # ==========================
 st.subheader("📊 Portfolio Overview")
 
-cols_to_show = [
-    "Ticker", "Quantity", "Current Value",
-    "Total Gain/Loss Percent", "Percent Of Account",
-]
-
-df_display = portfolio_df.copy()
-df_display["Current Value"] = df_display["Current Value"].replace('[\$,]', '', regex=True).astype(float)
-df_display["Percent Of Account"] = df_display["Percent Of Account"].replace('[\%,]', '', regex=True).astype(float)
-
-st.dataframe(df_display[cols_to_show], use_container_width=True)
+render_paged_dataframe(state.overview, key="portfolio_overview")
 
 
 # ==========================